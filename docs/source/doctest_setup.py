@@ -1,35 +1,96 @@
 import os
 import sys
 import re
-import logging
-import unittest.mock
+import functools
 
 from fixedpoint import *
 import fixedpoint.logging
+# The star import above brings in fixedpoint.logging as "logging"
+import logging
+
+# Matches the list of mismatched property values in a mismatch warning
+_MISMATCH_RE = re.compile(r"\['([a-z]+)', '([a-z]+)'\]")
+# Separates test names in the FIXEDPOINTDOCTEST environment variable
+_SEP_RE = re.compile(r'[,;:]')
 
 def reset_sn(sn=0):
     """Resets the FixedPoint serial number"""
     FixedPoint._SERIAL_NUMBER = sn
 
-def alphabetize_mismatches(record):
-    """Filters a log record and alphabetizes mismatches"""
-    newargs = list(record.args)
-    for i, warning in enumerate(newargs):
-        if not isinstance(warning, list):
-            continue
-        props = re.search(r"\['([a-z]+)', '([a-z]+)'\]", arg := str(warning))
-        if not props:
-            continue
-        sub = sorted([props.group(x) for x in (1, 2)])
-        newargs[i] = arg.replace(props.group(0), str(sub))
+def _is_mismatch_pair(warning):
+    """Determines if a list is exactly the pair of names in a mismatch"""
+    return len(warning) == 2 and all(
+        isinstance(w, str) and w.isascii() and w.isalpha() and w.islower()
+        for w in warning
+    )
+
+@functools.lru_cache(maxsize=1024)
+def _canonicalize(arg):
+    """Alphabetizes the first mismatch found in a stringified argument"""
+    props = _MISMATCH_RE.search(arg)
+    if not props:
+        return arg
+    a, b = props.groups()
+    lo, hi = (a, b) if a <= b else (b, a)
+    # The whole argument is the mismatch, nothing to search and replace
+    if props.span() == (0, len(arg)):
+        return f"['{lo}', '{hi}']"
+    return arg.replace(props[0], f"['{lo}', '{hi}']", 1)
+
+class _AlphaFilter(logging.Filter):
+    """Filters log records and alphabetizes mismatches"""
+
+    def filter(self, record):
+        # Most records have no list arguments at all
+        args = record.args
+        if not args or not any(isinstance(arg, list) for arg in args):
+            return True
+
+        # Remember (index, replacement) pairs, there's usually only one
+        changes = []
+        for i, warning in enumerate(args):
+            # Mismatches are always reported as a pair, don't stringify the rest
+            if not isinstance(warning, list) or len(warning) != 2:
+                continue
+            # Common case: the list is the mismatch itself, no need for regex
+            if _is_mismatch_pair(warning):
+                a, b = warning
+                lo, hi = (a, b) if a <= b else (b, a)
+                sub = f"['{lo}', '{hi}']"
+            elif (sub := _canonicalize(arg := str(warning))) == arg:
+                continue
+            changes.append((i, sub))
+
+        if len(changes) == 1:
+            (i, sub), = changes
+            record.args = args[:i] + (sub,) + args[i + 1:]
+        elif changes:
+            subs = dict(changes)
+            record.args = tuple(subs.get(i, arg) for i, arg in enumerate(args))
 
-    record.args = tuple(newargs)
+        return True
 
-    return True
+alphabetize_mismatches = _AlphaFilter()
+
+class _MinNPatcher:
+    """Swaps FixedPoint.min_n for a function returning a constant"""
+    __slots__ = ('_orig', '_rval')
+
+    def __init__(self, rval):
+        self._orig = None
+        self._rval = rval
+
+    def start(self):
+        # Save the staticmethod itself so stop() restores it exactly
+        self._orig = FixedPoint.__dict__['min_n']
+        FixedPoint.min_n = staticmethod(lambda *args, **kwargs: self._rval)
+
+    def stop(self):
+        FixedPoint.min_n = self._orig
 
 def patch_min_n(rval=2):
     """Patches FixedPoint.min_n to always return the same value"""
-    patcher = unittest.mock.patch('fixedpoint.FixedPoint.min_n', return_value=rval)
+    patcher = _MinNPatcher(rval)
     patcher.start()
     return patcher
 
@@ -38,13 +99,24 @@ def unpatch(patcher):
     patcher.stop()
 
 # Make warnings print to stdout instead of stderr
-fixedpoint.logging.WARNER_CONSOLE_HANDLER.stream = sys.stdout
-fixedpoint.logging.WARNER.removeFilter(alphabetize_mismatches)
-fixedpoint.logging.WARNER.addFilter(alphabetize_mismatches)
+_handler = fixedpoint.logging.WARNER_CONSOLE_HANDLER
+if _handler.stream is not sys.stdout:
+    _handler.stream = sys.stdout
+# This file is executed for every doctest group, so only install the filter
+# the first time around
+if not getattr(fixedpoint.logging.WARNER, '_alpha_installed', False):
+    fixedpoint.logging.WARNER.addFilter(alphabetize_mismatches)
+    fixedpoint.logging.WARNER._alpha_installed = True
 
 # A way to select specific doctests to run
+@functools.lru_cache(maxsize=1)
+def _enabled():
+    """Parses the doctests enabled via the environment, only once"""
+    envvar = os.environ.get('FIXEDPOINTDOCTEST', '')
+    enabled = frozenset(x.strip() for x in _SEP_RE.split(envvar) if x)
+    return enabled, bool(envvar)
+
 def should_skip(testname: str) -> bool:
     """Determines if a test should be skipped."""
-    envvar = os.environ.get('FIXEDPOINTDOCTEST', '')
-    enabled = [x.strip() for x in envvar.split(',;:') if x]
-    return envvar and testname not in enabled
+    enabled, nonempty = _enabled()
+    return nonempty and testname not in enabled
@@ -56,8 +56,7 @@ def test_bool():
     """Verify __bool__
     """
     # Make sure we hit some False cases
-    from math import log2 as _log2
-    Lmax = _log2(tools.NUM_ITERATIONS) // 1
+    Lmax = tools.NUM_ITERATIONS.bit_length() - 1
 
     result = {True: 0, False: 0}
     for nbit in tools.test_iterator():
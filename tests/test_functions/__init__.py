@@ -24,13 +24,14 @@ def test_resize_function():
     alerts = [x.name for x in uut.properties.Alert] + ['']
     strip_sn = lambda s: s.split('SN')[-1].lstrip('0123456789]: ')
 
-    for init, args, kwargs, *ignored in nondefault_props_gen():
+    # Draw every rounding method up front instead of once per iteration
+    rchoices = random.choices(roundings, k=tools.NUM_ITERATIONS)
+    for (init, args, kwargs, *ignored), r in zip(nondefault_props_gen(), rchoices):
         x = uut.FixedPoint(init, *args, **kwargs)
         mm = random.randrange(max(1, 2 * x.m))
         nn = random.randrange(max(1, 2 * x.n))
 
         o = random.choice(overflows)
-        r = random.choice(roundings)
         a = random.choice(alerts)
         UTLOG.debug("%s\nresize(%d, %d, %s, %s, %s)",
             x.qformat, mm, nn, o, r, a, **LOGID)
@@ -657,13 +658,14 @@ def test_keep_msbs_function():
     alerts = [x.name for x in uut.properties.Alert] + ['']
     strip_sn = lambda s: s.split('SN')[-1].lstrip('0123456789]: ')
 
-    for init, args, kwargs, *ignored in nondefault_props_gen():
+    # Draw every rounding method up front instead of once per iteration
+    rchoices = random.choices(roundings, k=tools.NUM_ITERATIONS)
+    for (init, args, kwargs, *ignored), r in zip(nondefault_props_gen(), rchoices):
         x = uut.FixedPoint(init, *args, **kwargs)
         mm = random.randrange(max(1, 2 * x.m))
         nn = random.randrange(max(1, 2 * x.n))
 
         o = random.choice(overflows)
-        r = random.choice(roundings)
         a = random.choice(alerts)
 
         # Attempt resizing. Make sure warnings/errors are equivalent between
@@ -936,7 +938,7 @@ def test_wrap_function():
 def test_sign():
     """Verify FixedPoint.sign
     """
-    bitsize = min(50, math.ceil(math.log2(tools.NUM_ITERATIONS)) // 2)
+    bitsize = min(50, (tools.NUM_ITERATIONS - 1).bit_length() // 2)
     for _ in tools.test_iterator():
         init = random.getrandbits(bitsize) * (2*random.randrange(2) - 1)
         x = uut.FixedPoint(init * 2**-random.randrange(bitsize))
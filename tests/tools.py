@@ -17,6 +17,7 @@ import pathlib
 import re
 import traceback
 import struct
+import mmap
 import shlex
 import platform
 from typing import Any, Dict, Tuple, Union
@@ -259,8 +260,13 @@ class MATLAB:
         to find stimulus. The name of the parsed stimulus file is the name of
         the calling function with a '.stim' extension.
 
+        The file is memory mapped and unpacked with spec.iter_unpack, so rows
+        are not read one at a time.
+
         Args:
             spec (struct.Struct): spec for how to unpack binary stimulus files
+            stacklimit (int): number of frames up the stack to find the
+                calling test function
 
         Yields:
             tuple: a tuple of values specified by the spec argument
@@ -269,10 +275,11 @@ class MATLAB:
         test = traceback.extract_stack(limit=stacklimit)[0]
         stim_file = f"{pathlib.Path(test.filename).parent / test.name!s}.stim"
         with open(stim_file, 'rb') as f:
-            binary = f.read(spec.size)
-            while binary:
-                yield spec.unpack(binary)
-                binary = f.read(spec.size)
+            # Empty files can't be memory mapped
+            if not os.fstat(f.fileno()).st_size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from spec.iter_unpack(mm)
 
 class TestCaseRotatingFileHandler(logging.handlers.BaseRotatingHandler):
     """Logging file handler that creates a new file for each new test that